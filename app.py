@@ -1,20 +1,52 @@
+import hashlib
+
 import streamlit as st
-from backend.process_audio import transcribe_audio
-from backend.phoneme_check import compare_pronunciation
 from backend.emotion_detect import detect_emotion
 
 st.title("SpeakEase – Emotion-Aware Communication Coach")
 
-word = st.text_input("Enter a word to practice:")
-if st.button("Play Correct Pronunciation"):
-    compare_pronunciation(word, word, play_only=True)
+# Streamlit reruns this script on every widget event; cache transcripts by
+# audio content so an unchanged upload is not sent to STT again. Only the
+# digest is hashed by Streamlit; the leading underscore skips the file itself.
+@st.cache_data(ttl=24 * 60 * 60, show_spinner="Transcribing audio...", max_entries=128)
+def _transcribe(digest, _audio_file):
+    from backend.process_audio import transcribe_audio
+
+    _audio_file.seek(0)
+    return transcribe_audio(_audio_file)
+
+def _digest(f):
+    # UploadedFile is a BytesIO: hash its buffer in place without copying
+    with f.getbuffer() as view:
+        return hashlib.blake2b(view, digest_size=16).hexdigest()
+
+# Inputs inside a form only trigger a rerun on submit, not on every keystroke
+with st.form("practice"):
+    word = st.text_input("Enter a word to practice:")
+    audio_file = st.file_uploader("Upload your speech (WAV format)", type=["wav"])
+    # Enter in the word box triggers the first submit button, so keep Analyze
+    # first to avoid an accidental gTTS request
+    submitted = st.form_submit_button("Analyze")
+    play = st.form_submit_button("Play Correct Pronunciation")
+
+if play and word:
+    from backend.phoneme_check import synthesize_pronunciation
+
+    st.audio(synthesize_pronunciation(word), format="audio/mp3")
+
+if submitted and audio_file and word:
+    from backend.phoneme_check import compare_pronunciation
 
-audio_file = st.file_uploader("Upload your speech (WAV format)", type=["wav"])
-if audio_file and word:
     st.audio(audio_file)
-    user_text = transcribe_audio(audio_file)
+    user_text = _transcribe(_digest(audio_file), audio_file)
     st.write(f"You said: **{user_text}**")
-    compare_pronunciation(user_text, word)
+    result = compare_pronunciation(user_text, word)
+    st.write(f"Target phonemes: **{result['target_phonemes']}**")
+    st.write(f"Your phonemes:   **{result['user_phonemes']}**")
+    if result["match"]:
+        st.success("✅ Good pronunciation!")
+    else:
+        st.error("❌ Needs improvement.")
 
 st.subheader("Facial Emotion Detection")
 st.markdown("Use webcam in browser to detect emotion via Teachable Machine.")
@@ -1,29 +1,92 @@
+import functools
+import hashlib
+import io
+import os
+import tempfile
+
 import pronouncing
-from gtts import gTTS
-import playsound
 
-def get_phonemes(word):
+@functools.lru_cache(maxsize=4096)
+def _lookup_phonemes(word):
     phones = pronouncing.phones_for_word(word)
     return phones[0] if phones else None
 
-def compare_pronunciation(user_word, target_word, play_only=False):
-    import os
-    import streamlit as st
-    
-    target_phonemes = get_phonemes(target_word)
-    if play_only:
-        tts = gTTS(text=target_word, lang='en')
-        tts.save("correct.mp3")
-        playsound.playsound("correct.mp3")
-        # Clean up the temporary file
-        if os.path.exists("correct.mp3"):
-            os.remove("correct.mp3")
+def get_phonemes(word):
+    return _lookup_phonemes(word.lower().strip())
+
+# Synthesized MP3s persist here so restarts and other sessions skip gTTS.
+# The directory is private to the user running the app (mode 0o700) and
+# pruned to the newest TTS_CACHE_MAX_FILES entries by mtime. Hits refresh
+# the mtime only on a process's first read (later ones are lru_cache hits),
+# so pruning order is approximately, not strictly, least recently used.
+TTS_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "swarsense",
+    "tts",
+)
+TTS_CACHE_MAX_FILES = 512
+
+def _prune_tts_cache():
+    entries = [e for e in os.scandir(TTS_CACHE_DIR) if e.name.endswith(".mp3")]
+    excess = len(entries) - TTS_CACHE_MAX_FILES
+    if excess <= 0:
         return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:excess]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
 
-    user_phonemes = get_phonemes(user_word)
-    st.write(f"Target phonemes: **{target_phonemes}**")
-    st.write(f"Your phonemes:   **{user_phonemes}**")
-    if user_phonemes == target_phonemes:
-        st.success("✅ Good pronunciation!")
+def _store_tts(path, audio):
+    os.makedirs(TTS_CACHE_DIR, mode=0o700, exist_ok=True)
+    # Write then rename so concurrent readers never see a partial file
+    tmp = tempfile.NamedTemporaryFile(dir=TTS_CACHE_DIR, suffix=".part", delete=False)
+    try:
+        with tmp:
+            tmp.write(audio)
+        os.replace(tmp.name, path)
+    except OSError:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+    _prune_tts_cache()
+
+@functools.lru_cache(maxsize=256)
+def synthesize_pronunciation(text, lang='en'):
+    key = hashlib.sha1(f"{lang}|{text}".encode()).hexdigest()
+    path = os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+    # The disk cache is best-effort: any OSError falls back to gTTS
+    try:
+        with open(path, "rb") as f:
+            audio = f.read()
+    except OSError:
+        pass
     else:
-        st.error("❌ Needs improvement.")
+        try:
+            os.utime(path)  # mark as recently used for pruning
+        except OSError:
+            pass
+        return audio
+
+    from gtts import gTTS
+
+    buf = io.BytesIO()
+    gTTS(text=text, lang=lang).write_to_fp(buf)
+    audio = buf.getvalue()
+    try:
+        _store_tts(path, audio)
+    except OSError:
+        pass
+    return audio
+
+def compare_pronunciation(user_word, target_word):
+    target_phonemes = get_phonemes(target_word)
+    user_phonemes = get_phonemes(user_word)
+    return {
+        "target_phonemes": target_phonemes,
+        "user_phonemes": user_phonemes,
+        "match": user_phonemes == target_phonemes,
+    }